@@ -0,0 +1,75 @@
+import re
+import subprocess
+import sys
+
+BUDGET_US = {
+    "design_patterns": 2000,
+    "design_patterns.hw1": 12000,
+    "design_patterns.hw2": 12000,
+    "design_patterns.hw3": 15000,
+    "design_patterns.hw4": 15000,
+    "design_patterns.hw5": 12000,
+    "design_patterns.hw8": 12000,
+    "design_patterns.hw9": 15000,
+    "design_patterns.paymentsystem": 12000,
+}
+
+BULK_ONLY = {"asyncio", "concurrent.futures", "csv", "json", "multiprocessing", "tempfile", "tracemalloc"}
+
+FORBIDDEN = {
+    "design_patterns.paymentsystem": {"design_patterns.hw9"},
+    "design_patterns.hw2": {"design_patterns.hw9"},
+    "design_patterns.hw3": BULK_ONLY,
+    "design_patterns.hw4": BULK_ONLY,
+    "design_patterns.hw5": BULK_ONLY,
+    "design_patterns.hw9": BULK_ONLY,
+}
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$")
+
+
+def measure(module, runs=3):
+    best = None
+    for _ in range(runs):
+        imported, output = measure_once(module)
+        if best is None or imported.get(module, 0) < best[0].get(module, 0):
+            best = imported, output
+    return best
+
+
+def measure_once(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    imported = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            imported[match.group(3).strip()] = int(match.group(2))
+    return imported, result.stdout
+
+
+def main():
+    failures = []
+    for module, budget in BUDGET_US.items():
+        imported, output = measure(module)
+        cumulative = imported.get(module, 0)
+        print(f"{module}: {cumulative} us (budget {budget} us)")
+        if cumulative > budget:
+            failures.append(f"{module} took {cumulative} us, budget is {budget} us")
+        if output:
+            failures.append(f"{module} printed output on import")
+        for name in FORBIDDEN.get(module, ()):
+            if name in imported:
+                failures.append(f"{module} imported {name}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import importlib
+
+_submodules = {
+    "hw1", "hw2", "hw3", "hw4", "hw5", "hw8", "hw9", "paymentsystem",
+    "output", "bench", "metrics", "sharded_library", "shared_rates", "observers",
+}
+
+_exports = {
+    "Library": "hw1",
+    "Book": "hw1",
+    "Reader": "hw1",
+    "Beverage": "hw8",
+    "HomeTheaterFacade": "hw9",
+    "AsyncHomeTheaterFacade": "hw9",
+    "Directory": "hw9",
+    "File": "hw9",
+    "ReportDirector": "hw5",
+    "VehicleFactory": "hw4",
+    "get_factory": "hw4",
+}
+
+__all__ = sorted(_submodules | set(_exports))
+
+
+def __getattr__(name):
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _exports:
+        value = getattr(importlib.import_module(f".{_exports[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,344 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import weakref
+
+from . import hw1, hw2, hw3, hw4, hw5, hw8, hw9, paymentsystem
+from .output import NullSink, set_sink
+
+_benchmarks = {}
+
+
+def benchmark(name):
+    def decorator(func):
+        _benchmarks[name] = func
+        return func
+    return decorator
+
+
+@benchmark("hw1_checkouts")
+def bench_library_checkouts(scale):
+    rng = random.Random(1)
+    library = hw1.Library()
+    books = int(10000 * scale) or 1
+    for i in range(books):
+        library.add_book(hw1.Book(f"Book {i}", "Author", str(i), 5))
+    for i in range(1000):
+        library.register_reader(hw1.Reader(f"Reader {i}", f"R{i}"))
+    requests = [(f"R{rng.randrange(1000)}", str(rng.randrange(books))) for _ in range(int(1000 * scale) or 1)]
+
+    def run():
+        for reader_id, isbn in requests:
+            library.issue_book(reader_id, isbn)
+            library.return_book(reader_id, isbn)
+    return len(requests) * 2, run
+
+
+@benchmark("hw2_observer_fanout")
+def bench_hw2_fanout(scale):
+    exchange = hw2.CurrencyExchange()
+    kinds = (hw2.MobileApp, hw2.WebDashboard, hw2.AlertSystem)
+    observers = [kinds[i % 3]() for i in range(int(10000 * scale) or 1)]
+    for observer in observers:
+        exchange.register_observer(observer)
+    rates = [400 + i for i in range(200)]
+
+    def run():
+        assert len(exchange.observers) == len(observers)
+        for rate in rates:
+            exchange.set_rate(rate)
+    return len(rates) * len(observers), run
+
+
+@benchmark("paymentsystem_observer_fanout")
+def bench_paymentsystem_fanout(scale):
+    exchange = paymentsystem.CurrencyExchange()
+    observers = []
+    for i in range(int(10000 * scale) or 1):
+        if i % 2:
+            observers.append(paymentsystem.SimpleDisplay(f"Display {i}"))
+        else:
+            observers.append(paymentsystem.AlertSystem(f"Alert {i}"))
+        exchange.register_observer(observers[-1])
+    rates = [1.0 + i / 1000 for i in range(200)]
+
+    def run():
+        assert len(exchange.observers) == len(observers)
+        for rate in rates:
+            exchange.set_rate("EUR/USD", rate)
+    return len(rates) * len(observers), run
+
+
+@benchmark("payment_strategies")
+def bench_payment_strategies(scale):
+    hw2_context = hw2.PaymentContext()
+    hw2_strategies = [hw2.BankCardPayment(), hw2.PayPalPayment(), hw2.CryptoPayment()]
+    context = paymentsystem.PaymentContext(paymentsystem.CardPayment("6367220123456789"))
+    strategies = [
+        paymentsystem.CardPayment("6367220123456789"),
+        paymentsystem.PayPalPayment("user@example.com"),
+        paymentsystem.CryptoPayment("0xAaBc789012445678901275367890123456789012"),
+    ]
+    payments = int(30000 * scale) or 1
+
+    def run():
+        for i in range(payments):
+            hw2_context.set_strategy(hw2_strategies[i % 3])
+            hw2_context.pay(100 + i)
+            context.set_strategy(strategies[i % 3])
+            context.execute_payment(100 + i)
+    return payments * 2, run
+
+
+@benchmark("hw8_decorator_chain")
+def bench_decorator_chain(scale):
+    decorators = (hw8.Milk, hw8.Sugar, hw8.WhippedCream)
+    drink = hw8.Mocha()
+    for i in range(500):
+        drink = decorators[i % 3](drink)
+    calls = int(2000 * scale) or 1
+
+    def run():
+        for _ in range(calls):
+            drink.cost()
+            drink.get_description()
+    return calls, run
+
+
+@benchmark("hw5_clone_total")
+def bench_clone_total(scale):
+    rng = random.Random(5)
+    products = [hw5.Product(f"Product {i}", rng.uniform(1, 100), rng.randrange(1, 10)) for i in range(100)]
+    order = hw5.Order(1, products, 25, hw5.Discount("Standard", 0.1))
+    clones = int(2000 * scale) or 1
+
+    def run():
+        for _ in range(clones):
+            order.clone().calculate_total()
+    return clones, run
+
+
+@benchmark("hw9_composite")
+def bench_composite(scale):
+    files = int(1000000 * scale) or 1
+    root = hw9.Directory("root")
+    level = [root]
+    while len(level) * 10 < files / 10:
+        next_level = []
+        for directory in level:
+            for i in range(10):
+                child = hw9.Directory(f"{directory.name}/{i}")
+                directory.contents.append(child)
+                next_level.append(child)
+        level = next_level
+    for i in range(files):
+        level[i % len(level)].contents.append(hw9.File(f"file{i}", i % 1000))
+
+    def run():
+        root.get_size()
+        root.display()
+    return files, run
+
+
+def _payroll_records(scale):
+    rng = random.Random(3)
+    kinds = (hw3.PermanentEmployee, hw3.ContractEmployee, hw3.Intern)
+    return [(i, kinds[rng.randrange(3)], rng.uniform(500, 5000)) for i in range(int(500000 * scale) or 1)]
+
+
+@benchmark("hw3_payroll_objects")
+def bench_payroll_objects(scale):
+    records = _payroll_records(scale)
+    calculator = hw3.SalaryCalculator()
+
+    def run():
+        return {i: calculator.get_salary(kind(base)) for i, kind, base in records}
+    return len(records), run
+
+
+@benchmark("hw3_payroll_batch")
+def bench_payroll_batch(scale):
+    records = _payroll_records(scale)
+    expected = bench_payroll_objects(scale)[1]()
+    assert hw3.BatchPayroll().run(records).salaries == expected
+
+    def run():
+        hw3.BatchPayroll().run(records)
+    return len(records), run
+
+
+class _RemotePaymentProcessor(hw3.PaymentProcessor):
+    def __init__(self, latency):
+        self.latency = latency
+
+    def process(self, payment_method):
+        time.sleep(self.latency)
+        super().process(payment_method)
+
+
+def _order_entries(scale):
+    rng = random.Random(6)
+    methods = ("Bank Card", "PayPal")
+    return [(hw3.Order(f"Product {i}", rng.randrange(1, 5), rng.uniform(5, 500)), methods[i % 2], f"user{i}@example.com")
+            for i in range(int(2000 * scale) or 1)]
+
+
+@benchmark("hw3_orders_sequential")
+def bench_orders_sequential(scale):
+    entries = _order_entries(scale)
+    calculator = hw3.PriceCalculator()
+    processor = _RemotePaymentProcessor(0.0002)
+    notifier = hw3.Notifier()
+
+    def run():
+        for order, method, email in entries:
+            calculator.calculate_total(order)
+            processor.process(method)
+            notifier.send_confirmation(email)
+    return len(entries), run
+
+
+@benchmark("hw3_orders_pipeline")
+def bench_orders_pipeline(scale):
+    entries = _order_entries(scale)
+    pipeline = hw3.OrderPipeline(processor=_RemotePaymentProcessor(0.0002), batch_size=100)
+
+    def run():
+        pipeline.run(entries)
+    return len(entries), run
+
+
+@benchmark("hw4_factory_throughput")
+def bench_factory_throughput(scale):
+    rng = random.Random(4)
+    records = [
+        ('car', {'make': 'Toyota', 'model': 'Corolla', 'fuel': 'petrol'}),
+        ('motorcycle', {'type': 'sport', 'volume': '600'}),
+        ('truck', {'capacity': '12.5', 'axles': '3'}),
+        ('bus', {'capacity': '50', 'route': '7A'}),
+        ('scooter', {'battery': '80', 'range': '25'}),
+    ]
+    batch = [rng.choice(records) for _ in range(int(100000 * scale) or 1)]
+
+    def run():
+        for vehicle_type, params in batch:
+            factory, schema = hw4.get_factory(vehicle_type)
+            factory.create_vehicle(hw4.coerce_params(schema, params))
+    return len(batch), run
+
+
+@benchmark("shared_rate_cross_reads")
+def bench_shared_rates(scale):
+    from .shared_rates import CrossRateCache, SharedRateTable
+
+    table = SharedRateTable.create(["EUR/USD", "GBP/USD", "USD/JPY"])
+    for pair, rate in (("EUR/USD", 1.085), ("GBP/USD", 1.27), ("USD/JPY", 151.2)):
+        table.publish(pair, rate)
+    cache = CrossRateCache(table)
+    reads = int(100000 * scale) or 1
+
+    def run():
+        for i in range(reads):
+            if i % 100 == 0:
+                table.publish("EUR/USD", 1.085 + i / 1e6)
+            cache.rate("EUR", "JPY")
+    weakref.finalize(run, table.close)
+    return reads, run
+
+
+@benchmark("observer_churn")
+def bench_observer_churn(scale):
+    rng = random.Random(42)
+    subscribers = int(100000 * scale) or 1
+    order = list(range(subscribers))
+    rng.shuffle(order)
+
+    def run():
+        exchange = hw2.CurrencyExchange()
+        observers = [hw2.MobileApp() for _ in range(subscribers)]
+        for i in range(subscribers):
+            exchange.register_observer(observers[i])
+        for i in order[:subscribers // 2]:
+            exchange.remove_observer(observers[i])
+        exchange.set_rate(405)
+        del observers
+        assert not exchange.observers
+    return subscribers, run
+
+
+def run_benchmarks(names=None, scale=1.0, repeat=3):
+    previous = set_sink(NullSink())
+    results = {}
+    try:
+        for name in names or _benchmarks:
+            ops, run = _benchmarks[name](scale)
+            best = min(_time(run) for _ in range(repeat))
+            results[name] = {
+                "ops": ops,
+                "seconds": best,
+                "ops_per_second": ops / best if best else 0.0,
+            }
+    finally:
+        set_sink(previous)
+    return {
+        "python": platform.python_version(),
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _time(run):
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def compare(results, baseline, tolerance=0.2):
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = current["ops_per_second"] / previous["ops_per_second"]
+        if ratio < 1 - tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the design pattern modules.")
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"benchmarks to run (default: all of {', '.join(_benchmarks)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="workload size multiplier")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is kept")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before failing")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(_benchmarks)
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(args.names or None, args.scale, args.repeat)
+    for name, result in results["results"].items():
+        print(f"{name:32} {result['ops_per_second']:>14,.0f} ops/s  ({result['seconds']:.3f}s)")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for name, ratio in regressions:
+            print(f"REGRESSION: {name} at {ratio:.0%} of baseline")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+from .output import emit
+
+
+class Book:
+    def __init__(self, title, author, isbn, copies):
+        self.title = title
+        self.author = author
+        self.isbn = isbn
+        self.copies = copies
+
+
+class Reader:
+    def __init__(self, name, reader_id):
+        self.name = name
+        self.reader_id = reader_id
+        self.borrowed_books = []
+
+
+class Library:
+    def __init__(self):
+        self.books = []
+        self.readers = []
+
+    def add_book(self, book):
+        self.books.append(book)
+
+    def remove_book(self, isbn):
+        for b in self.books:
+            if b.isbn == isbn:
+                self.books.remove(b)
+                break
+
+    def register_reader(self, reader):
+        self.readers.append(reader)
+
+    def find_reader(self, reader_id):
+        return next((r for r in self.readers if r.reader_id == reader_id), None)
+
+    def find_book(self, isbn, available=False):
+        return next((b for b in self.books if b.isbn == isbn and (b.copies > 0 or not available)), None)
+
+    def checkout(self, reader_id, isbn):
+        reader = self.find_reader(reader_id)
+        book = self.find_book(isbn, available=True)
+        if not (reader and book):
+            return None
+        reader.borrowed_books.append(book)
+        book.copies -= 1
+        return book, reader
+
+    def checkin(self, reader_id, isbn, restock=True):
+        reader = self.find_reader(reader_id)
+        if not reader:
+            return "no_reader", None, None
+        for book in reader.borrowed_books:
+            if book.isbn == isbn:
+                if restock:
+                    book.copies += 1
+                reader.borrowed_books.remove(book)
+                return "ok", book, reader
+        return "not_borrowed", None, None
+
+    @staticmethod
+    def report_issue(title=None, reader=None):
+        if title is None:
+            emit("Library", "issue_failed", "Book not available or reader not found")
+        else:
+            emit("Library", "book_issued", "{title} issued to {reader}", title=title, reader=reader)
+
+    @staticmethod
+    def report_return(status, title=None, reader=None):
+        if status == "no_reader":
+            emit("Library", "reader_not_found", "Reader not found")
+        elif status == "not_borrowed":
+            emit("Library", "return_failed", "Book not found in borrowed list")
+        else:
+            emit("Library", "book_returned", "{title} returned by {reader}", title=title, reader=reader)
+
+    def issue_book(self, reader_id, isbn):
+        issued = self.checkout(reader_id, isbn)
+        if issued:
+            book, reader = issued
+            self.report_issue(book.title, reader.name)
+        else:
+            self.report_issue()
+        return bool(issued)
+
+    def return_book(self, reader_id, isbn):
+        status, book, reader = self.checkin(reader_id, isbn)
+        if status == "ok":
+            self.report_return(status, book.title, reader.name)
+        else:
+            self.report_return(status)
+        return status == "ok"
+
+
+def main():
+    library = Library()
+    b1 = Book("The Great Gatsby", "F. Scott Fitzgerald", "1111", 3)
+    b2 = Book("1984", "George Orwell", "2222", 2)
+    library.add_book(b1)
+    library.add_book(b2)
+
+    r1 = Reader("Alice", "R1")
+    r2 = Reader("Bob", "R2")
+    library.register_reader(r1)
+    library.register_reader(r2)
+
+    library.issue_book("R1", "1111")
+    library.issue_book("R2", "2222")
+    library.return_book("R1", "1111")
+
+
+if __name__ == "__main__":
+    main()
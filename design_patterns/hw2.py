@@ -1,3 +1,7 @@
+from .observers import ObserverRegistry
+from .output import emit
+
+
 class IPaymentStrategy:
     def pay(self, amount):
         pass
@@ -5,17 +9,17 @@ class IPaymentStrategy:
 
 class BankCardPayment(IPaymentStrategy):
     def pay(self, amount):
-        print(f"Paid {amount}$ using Bank Card.")
+        emit("BankCardPayment", "paid", "Paid {amount}$ using Bank Card.", amount=amount)
 
 
 class PayPalPayment(IPaymentStrategy):
     def pay(self, amount):
-        print(f"Paid {amount}$ using PayPal.")
+        emit("PayPalPayment", "paid", "Paid {amount}$ using PayPal.", amount=amount)
 
 
 class CryptoPayment(IPaymentStrategy):
     def pay(self, amount):
-        print(f"Paid {amount}$ using Cryptocurrency.")
+        emit("CryptoPayment", "paid", "Paid {amount}$ using Cryptocurrency.", amount=amount)
 
 
 class PaymentContext:
@@ -29,7 +33,7 @@ class PaymentContext:
         if self.strategy:
             self.strategy.pay(amount)
         else:
-            print("No payment method selected.")
+            emit("PaymentContext", "no_strategy", "No payment method selected.")
 
 
 class IObserver:
@@ -50,11 +54,11 @@ class ISubject:
 
 class CurrencyExchange(ISubject):
     def __init__(self):
-        self.observers = []
+        self.observers = ObserverRegistry()
         self.rate = 0
 
     def register_observer(self, observer):
-        self.observers.append(observer)
+        self.observers.add(observer)
 
     def remove_observer(self, observer):
         self.observers.remove(observer)
@@ -70,20 +74,20 @@ class CurrencyExchange(ISubject):
 
 class MobileApp(IObserver):
     def update(self, rate):
-        print(f"[MobileApp] New rate: {rate}$")
+        emit("MobileApp", "rate_updated", "[MobileApp] New rate: {rate}$", rate=rate)
 
 
 class WebDashboard(IObserver):
     def update(self, rate):
-        print(f"[WebDashboard] Rate displayed: {rate}$")
+        emit("WebDashboard", "rate_updated", "[WebDashboard] Rate displayed: {rate}$", rate=rate)
 
 
 class AlertSystem(IObserver):
     def update(self, rate):
         if rate > 500:
-            print(f"[AlertSystem] Warning! Rate too high: {rate}$")
+            emit("AlertSystem", "rate_alert", "[AlertSystem] Warning! Rate too high: {rate}$", rate=rate)
         else:
-            print(f"[AlertSystem] Rate is stable: {rate}$")
+            emit("AlertSystem", "rate_stable", "[AlertSystem] Rate is stable: {rate}$", rate=rate)
 
 
 def main():
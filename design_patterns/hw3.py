@@ -0,0 +1,552 @@
+import math
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from itertools import chain, islice
+from operator import itemgetter, mul
+
+from .output import emit
+
+class Order:
+    def __init__(self, product_name, quantity, price):
+        self.product_name = product_name
+        self.quantity = quantity
+        self.price = price
+
+
+class PriceCalculator:
+    discount_multiplier = 0.9
+
+    def calculate_total(self, order):
+        return order.quantity * order.price * self.discount_multiplier
+
+    def calculate_totals(self, orders):
+        if type(self).calculate_total is not PriceCalculator.calculate_total:
+            return [self.calculate_total(order) for order in orders]
+        multiplier = self.discount_multiplier
+        return [order.quantity * order.price * multiplier for order in orders]
+
+
+class PaymentProcessor:
+    def process(self, payment_method):
+        emit("PaymentProcessor", "payment_processed", "Payment processed using {method}", method=payment_method)
+
+
+class Notifier:
+    def send_confirmation(self, email):
+        emit("Notifier", "confirmation_sent", "Confirmation email sent to {email}", email=email)
+
+
+class Employee(ABC):
+    def __init__(self, base_salary):
+        self.base_salary = base_salary
+
+    @abstractmethod
+    def calculate_salary(self):
+        pass
+
+
+class PermanentEmployee(Employee):
+    salary_multiplier = 1.2
+
+    def calculate_salary(self):
+        return self.base_salary * self.salary_multiplier
+
+
+class ContractEmployee(Employee):
+    salary_multiplier = 1.1
+
+    def calculate_salary(self):
+        return self.base_salary * self.salary_multiplier
+
+
+class Intern(Employee):
+    salary_multiplier = 1
+
+    def calculate_salary(self):
+        return self.base_salary * self.salary_multiplier
+
+
+class SalaryCalculator:
+    def get_salary(self, employee: Employee):
+        return employee.calculate_salary()
+
+
+class PayrollResult:
+    def __init__(self):
+        self.salaries = {}
+        self._chunks = []
+        self._totals = None
+
+    def add(self, ids, classes, salaries):
+        self.salaries.update(zip(ids, salaries))
+        self._chunks.append((classes, salaries))
+        self._totals = None
+
+    @property
+    def totals(self):
+        if self._totals is None:
+            groups = defaultdict(list)
+            for classes, salaries in self._chunks:
+                for employee_class, salary in zip(classes, salaries):
+                    groups[employee_class.__name__].append(salary)
+            self._totals = {name: math.fsum(group) for name, group in groups.items()}
+        return self._totals
+
+    @property
+    def total(self):
+        return math.fsum(chain.from_iterable(salaries for _, salaries in self._chunks))
+
+
+class BatchPayroll:
+    employee_types = {
+        "permanent": PermanentEmployee,
+        "contract": ContractEmployee,
+        "intern": Intern,
+    }
+    multiplier_formulas = {
+        PermanentEmployee.calculate_salary,
+        ContractEmployee.calculate_salary,
+        Intern.calculate_salary,
+    }
+
+    def __init__(self, chunk_size=100000):
+        self.chunk_size = chunk_size
+
+    def run(self, records):
+        result = PayrollResult()
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                return result
+            ids, classes, bases = (list(map(itemgetter(column), chunk)) for column in range(3))
+            multipliers = self._multipliers(classes)
+            if len(multipliers) == len(set(classes)):
+                salaries = list(map(mul, bases, map(multipliers.__getitem__, classes)))
+            else:
+                salaries = [b * multipliers[c] if c in multipliers else c(b).calculate_salary()
+                            for c, b in zip(classes, bases)]
+            result.add(ids, classes, salaries)
+
+    def run_employees(self, employees):
+        employees = list(employees)
+        classes = list(map(type, employees))
+        multipliers = self._multipliers(classes)
+        if len(multipliers) == len(set(classes)):
+            salaries = [e.base_salary * e.salary_multiplier for e in employees]
+        else:
+            salaries = [e.base_salary * e.salary_multiplier if type(e) in multipliers else e.calculate_salary()
+                        for e in employees]
+        result = PayrollResult()
+        result.add(range(len(employees)), classes, salaries)
+        return result
+
+    def run_csv(self, path):
+        import csv
+        with open(path, newline="") as file:
+            rows = csv.DictReader(file)
+            records = (
+                (row["employee_id"], self.employee_types[row["type"].lower()], float(row["base_salary"]))
+                for row in rows
+            )
+            return self.run(records)
+
+    def _multipliers(self, classes):
+        return {c: c.salary_multiplier for c in set(classes) if c.calculate_salary in self.multiplier_formulas}
+
+
+class IPrinter(ABC):
+    @abstractmethod
+    def print(self, content):
+        pass
+
+
+class IScanner(ABC):
+    @abstractmethod
+    def scan(self, content):
+        pass
+
+
+class IFax(ABC):
+    @abstractmethod
+    def fax(self, content):
+        pass
+
+
+class BasicPrinter(IPrinter):
+    def print(self, content):
+        emit("BasicPrinter", "printed", "Printing: {content}", content=content)
+
+
+class MultiFunctionPrinter(IPrinter, IScanner, IFax):
+    def print(self, content):
+        emit("MultiFunctionPrinter", "printed", "Printing: {content}", content=content)
+
+    def scan(self, content):
+        emit("MultiFunctionPrinter", "scanned", "Scanning: {content}", content=content)
+
+    def fax(self, content):
+        emit("MultiFunctionPrinter", "faxed", "Faxing: {content}", content=content)
+
+
+class IMessageSender(ABC):
+    @abstractmethod
+    def send(self, message):
+        pass
+
+
+class EmailSender(IMessageSender):
+    def send(self, message):
+        emit("EmailSender", "sent", "Email sent: {message}", message=message)
+
+
+class SmsSender(IMessageSender):
+    def send(self, message):
+        emit("SmsSender", "sent", "SMS sent: {message}", message=message)
+
+
+class NotificationService:
+    def __init__(self, sender: IMessageSender):
+        self.sender = sender
+
+    def notify(self, message):
+        self.sender.send(message)
+
+
+class FakeMessageSender(IMessageSender):
+    def __init__(self, latency=0.0, failure_rate=0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, message):
+        import random
+        time.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError("delivery failed")
+        with self._lock:
+            self.sent.append(message)
+
+
+class RateLimiter:
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+class QueuedNotificationService:
+    _stop = object()
+
+    def __init__(self, senders, batch_size=50, rate_limits=None, max_retries=3,
+                 retry_delay=0.05, workers=8, latency_window=1024):
+        self.senders = senders
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        rate_limits = rate_limits or {}
+        self.limiters = {channel: RateLimiter(rate_limits.get(channel)) for channel in senders}
+        self.queues = {channel: queue.Queue() for channel in senders}
+        self.delivered = 0
+        self.failed = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=latency_window)
+        self.latency_total = 0.0
+        self.closed = False
+        self._metrics_lock = threading.Lock()
+        from concurrent.futures import ThreadPoolExecutor
+        self._pool = ThreadPoolExecutor(workers)
+        self._threads = [
+            threading.Thread(target=self._consume, args=(channel,), daemon=True)
+            for channel in senders
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def notify(self, message, channel=None):
+        if self.closed:
+            raise RuntimeError("notification service is closed")
+        channel = channel or next(iter(self.senders))
+        self.queues[channel].put((time.perf_counter(), message))
+
+    def flush(self):
+        for q in self.queues.values():
+            q.join()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.flush()
+        for q in self.queues.values():
+            q.put(self._stop)
+        for thread in self._threads:
+            thread.join()
+        self._pool.shutdown()
+
+    def metrics(self):
+        with self._metrics_lock:
+            latencies = sorted(self.latencies)
+        return {
+            "queue_depth": {channel: q.qsize() for channel, q in self.queues.items()},
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retries": self.retries,
+            "avg_latency": self.latency_total / self.delivered if self.delivered else 0.0,
+            "p95_latency": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        }
+
+    def _consume(self, channel):
+        q = self.queues[channel]
+        in_flight = threading.BoundedSemaphore(self.batch_size * 2)
+
+        def delivered(future):
+            in_flight.release()
+            q.task_done()
+
+        while True:
+            item = q.get()
+            if item is self._stop:
+                q.task_done()
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._stop:
+                    q.task_done()
+                    q.put(self._stop)
+                    break
+                batch.append(item)
+            for entry in batch:
+                in_flight.acquire()
+                self._pool.submit(self._deliver, channel, *entry).add_done_callback(delivered)
+
+    def _deliver(self, channel, enqueued_at, message):
+        sender = self.senders[channel]
+        for attempt in range(self.max_retries + 1):
+            self.limiters[channel].acquire()
+            try:
+                sender.send(message)
+            except Exception:
+                if attempt == self.max_retries:
+                    with self._metrics_lock:
+                        self.failed += 1
+                    return
+                with self._metrics_lock:
+                    self.retries += 1
+                time.sleep(self.retry_delay * 2 ** attempt)
+            else:
+                with self._metrics_lock:
+                    self.delivered += 1
+                    latency = time.perf_counter() - enqueued_at
+                    self.latencies.append(latency)
+                    self.latency_total += latency
+                return
+
+
+class OrderPipeline:
+    _done = object()
+
+    def __init__(self, calculator=None, processor=None, notifications=None,
+                 batch_size=1000, payment_workers=4, queue_size=8):
+        self.calculator = calculator or PriceCalculator()
+        self.processor = processor or PaymentProcessor()
+        self.notifications = notifications
+        self.batch_size = batch_size
+        self.payment_workers = payment_workers
+        self.queue_size = queue_size
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def read_csv(path):
+        import csv
+        with open(path, newline="") as file:
+            for row in csv.DictReader(file):
+                order = Order(row["product_name"], int(row["quantity"]), float(row["price"]))
+                yield order, row["payment_method"], row["email"]
+
+    def run_csv(self, path):
+        return self.run(self.read_csv(path))
+
+    def run(self, entries):
+        self.counters.clear()
+        batches = queue.Queue(self.queue_size)
+        priced = queue.Queue(self.queue_size)
+        paid = queue.Queue(self.queue_size)
+        start = time.perf_counter()
+
+        stages = [threading.Thread(target=self._price, args=(batches, priced))]
+        stages += [threading.Thread(target=self._pay, args=(priced, paid))
+                   for _ in range(self.payment_workers)]
+        stages.append(threading.Thread(target=self._notify, args=(paid,)))
+        for stage in stages:
+            stage.start()
+
+        try:
+            batch = []
+            for entry in entries:
+                batch.append(entry)
+                if len(batch) >= self.batch_size:
+                    batches.put(batch)
+                    self._count("read", len(batch))
+                    batch = []
+            if batch:
+                batches.put(batch)
+                self._count("read", len(batch))
+        finally:
+            batches.put(self._done)
+            for stage in stages:
+                stage.join()
+        if self.notifications is not None:
+            self.notifications.flush()
+
+        elapsed = time.perf_counter() - start
+        return {
+            "seconds": elapsed,
+            "counters": dict(self.counters),
+            "throughput": {stage: count / elapsed if elapsed else 0.0
+                           for stage, count in self.counters.items()},
+        }
+
+    def _count(self, stage, n=1):
+        with self._lock:
+            self.counters[stage] += n
+
+    def _price(self, batches, priced):
+        batch = None
+        try:
+            while True:
+                batch = batches.get()
+                if batch is self._done:
+                    return
+                orders = [order for order, _, _ in batch]
+                try:
+                    totals = self.calculator.calculate_totals(orders)
+                except Exception:
+                    totals = [self._price_one(order) for order in orders]
+                items = [(order, total, method, email)
+                         for (order, method, email), total in zip(batch, totals) if total is not None]
+                priced.put(items)
+                self._count("priced", len(items))
+        finally:
+            while batch is not self._done:
+                batch = batches.get()
+            for _ in range(self.payment_workers):
+                priced.put(self._done)
+
+    def _price_one(self, order):
+        try:
+            return self.calculator.calculate_total(order)
+        except Exception:
+            self._count("pricing_failed")
+            return None
+
+    def _pay(self, priced, paid):
+        try:
+            while True:
+                items = priced.get()
+                if items is self._done:
+                    return
+                done = []
+                for item in items:
+                    try:
+                        self.processor.process(item[2])
+                    except Exception:
+                        self._count("payment_failed")
+                        continue
+                    done.append(item)
+                paid.put(done)
+                self._count("paid", len(done))
+        finally:
+            paid.put(self._done)
+
+    def _notify(self, paid):
+        finished = 0
+        notifier = Notifier()
+        while finished < self.payment_workers:
+            items = paid.get()
+            if items is self._done:
+                finished += 1
+                continue
+            notified = 0
+            for order, total, method, email in items:
+                try:
+                    if self.notifications is None:
+                        notifier.send_confirmation(email)
+                    else:
+                        self.notifications.notify(f"{email}: order for {order.product_name} confirmed, total {total:.2f}")
+                except Exception:
+                    self._count("notification_failed")
+                    continue
+                notified += 1
+            self._count("notified", notified)
+
+
+def main():
+    order = Order("Laptop", 2, 800)
+    calculator = PriceCalculator()
+    print("Total price:", calculator.calculate_total(order))
+    processor = PaymentProcessor()
+    processor.process("Bank Card")
+    notifier = Notifier()
+    notifier.send_confirmation("zhemeneynika@gmail.com")
+
+    employee1 = PermanentEmployee(1000)
+    employee2 = ContractEmployee(800)
+    salary_calc = SalaryCalculator()
+    print("Permanent employee salary:", salary_calc.get_salary(employee1))
+    print("Contract employee salary:", salary_calc.get_salary(employee2))
+    payroll = BatchPayroll().run_employees([employee1, employee2, Intern(500)])
+    print("Payroll total:", payroll.total)
+
+    printer = BasicPrinter()
+    printer.print("Test Document")
+    mfp = MultiFunctionPrinter()
+    mfp.print("Invoice")
+    mfp.scan("Report")
+    mfp.fax("Contract")
+
+    email_sender = EmailSender()
+    sms_sender = SmsSender()
+    email_notifier = NotificationService(email_sender)
+    sms_notifier = NotificationService(sms_sender)
+    email_notifier.notify("Your order has been shipped!")
+    sms_notifier.notify("Payment received successfully!")
+
+    fake_email = FakeMessageSender(latency=0.01, failure_rate=0.1)
+    fake_sms = FakeMessageSender(latency=0.01)
+    service = QueuedNotificationService({"email": fake_email, "sms": fake_sms}, rate_limits={"sms": 500})
+    for i in range(100):
+        service.notify(f"Order {i} confirmed", "email")
+        service.notify(f"Order {i} shipped", "sms")
+    service.close()
+    print("Queued delivery metrics:", service.metrics())
+
+    service = QueuedNotificationService({"email": FakeMessageSender()})
+    pipeline = OrderPipeline(notifications=service, batch_size=2, payment_workers=2)
+    entries = [(Order("Laptop", 2, 800), "Bank Card", "a@example.com"),
+               (Order("Mouse", 1, 20), "PayPal", "b@example.com"),
+               (Order("Monitor", 1, 300), "Bank Card", "c@example.com")]
+    stats = pipeline.run(entries)
+    service.close()
+    print("Pipeline counters:", stats["counters"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+
+from .output import emit
+
+class IVehicle(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def drive(self):
+        pass
+
+    @abstractmethod
+    def refuel(self):
+        pass
+
+
+class Car(IVehicle):
+    __slots__ = ('make', 'model', 'fuel_type')
+
+    def __init__(self, make, model, fuel_type):
+        self.make = make
+        self.model = model
+        self.fuel_type = fuel_type
+
+    def drive(self):
+        emit("Car", "drive", "Car {make} {model} is driving.", make=self.make, model=self.model)
+
+    def refuel(self):
+        emit("Car", "refuel", "Car is refueling with {fuel}.", fuel=self.fuel_type)
+
+
+class Motorcycle(IVehicle):
+    __slots__ = ('bike_type', 'engine_volume')
+
+    def __init__(self, bike_type, engine_volume):
+        self.bike_type = bike_type
+        self.engine_volume = engine_volume
+
+    def drive(self):
+        emit("Motorcycle", "drive", "{bike_type} motorcycle is moving at {volume}cc.",
+             bike_type=self.bike_type.capitalize(), volume=self.engine_volume)
+
+    def refuel(self):
+        emit("Motorcycle", "refuel", "Motorcycle is refueling.")
+
+
+class Truck(IVehicle):
+    __slots__ = ('load_capacity', 'axles')
+
+    def __init__(self, load_capacity, axles):
+        self.load_capacity = load_capacity
+        self.axles = axles
+
+    def drive(self):
+        emit("Truck", "drive", "Truck with {axles} axles carrying {capacity} tons is on the move.",
+             axles=self.axles, capacity=self.load_capacity)
+
+    def refuel(self):
+        emit("Truck", "refuel", "Truck is refueling with diesel.")
+
+
+class Bus(IVehicle):
+    __slots__ = ('capacity', 'route')
+
+    def __init__(self, capacity, route):
+        self.capacity = capacity
+        self.route = route
+
+    def drive(self):
+        emit("Bus", "drive", "Bus with capacity {capacity} is on route {route}.", capacity=self.capacity, route=self.route)
+
+    def refuel(self):
+        emit("Bus", "refuel", "Bus is refueling.")
+
+
+class ElectricScooter(IVehicle):
+    __slots__ = ('battery_level', 'range_km')
+
+    def __init__(self, battery_level, range_km):
+        self.battery_level = battery_level
+        self.range_km = range_km
+
+    def drive(self):
+        emit("ElectricScooter", "drive", "Electric scooter is riding silently ({battery}% battery).",
+             battery=self.battery_level)
+
+    def refuel(self):
+        emit("ElectricScooter", "refuel", "Scooter is charging its battery.")
+
+
+class VehiclePool:
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._free = {}
+        self._pooled = set()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, vehicle_class, *args) -> IVehicle:
+        with self._lock:
+            free = self._free.get(vehicle_class)
+            vehicle = free.pop() if free else None
+            if vehicle is None:
+                self.created += 1
+            else:
+                self._pooled.discard(id(vehicle))
+                self.reused += 1
+        if vehicle is None:
+            return vehicle_class(*args)
+        vehicle.__init__(*args)
+        return vehicle
+
+    def release(self, vehicle: IVehicle):
+        with self._lock:
+            if id(vehicle) in self._pooled:
+                raise ValueError("vehicle was already released to the pool")
+            free = self._free.setdefault(type(vehicle), [])
+            if len(free) < self.max_size:
+                free.append(vehicle)
+                self._pooled.add(id(vehicle))
+
+
+class VehicleFactory(ABC):
+    pool = None
+
+    @abstractmethod
+    def create_vehicle(self, params: dict) -> IVehicle:
+        pass
+
+    def enable_pool(self, max_size: int = 1024):
+        self.pool = VehiclePool(max_size)
+
+    def disable_pool(self):
+        self.pool = None
+
+    def release(self, vehicle: IVehicle):
+        if self.pool is not None:
+            self.pool.release(vehicle)
+
+    def _build(self, vehicle_class, *args) -> IVehicle:
+        if self.pool is None:
+            return vehicle_class(*args)
+        return self.pool.acquire(vehicle_class, *args)
+
+
+_factories = {}
+
+
+def register_factory(vehicle_type: str, **schema):
+    def decorator(factory_class):
+        _factories[vehicle_type.lower()] = (factory_class(), tuple(schema.items()))
+        return factory_class
+    return decorator
+
+
+def strict_int(value) -> int:
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"expected an integer, got {value!r}")
+    return int(value)
+
+
+def coerce_params(schema, params: dict) -> dict:
+    return {name: cast(params[name]) for name, cast in schema}
+
+
+@register_factory('car', make=str, model=str, fuel=str)
+class CarFactory(VehicleFactory):
+    def create_vehicle(self, params: dict) -> IVehicle:
+        return self._build(Car, params['make'], params['model'], params['fuel'])
+
+
+@register_factory('motorcycle', type=str, volume=strict_int)
+class MotorcycleFactory(VehicleFactory):
+    def create_vehicle(self, params: dict) -> IVehicle:
+        return self._build(Motorcycle, params['type'], params['volume'])
+
+
+@register_factory('truck', capacity=float, axles=strict_int)
+class TruckFactory(VehicleFactory):
+    def create_vehicle(self, params: dict) -> IVehicle:
+        return self._build(Truck, params['capacity'], params['axles'])
+
+
+@register_factory('bus', capacity=strict_int, route=str)
+class BusFactory(VehicleFactory):
+    def create_vehicle(self, params: dict) -> IVehicle:
+        return self._build(Bus, params['capacity'], params['route'])
+
+
+@register_factory('scooter', battery=strict_int, range=float)
+class ElectricScooterFactory(VehicleFactory):
+    def create_vehicle(self, params: dict) -> IVehicle:
+        return self._build(ElectricScooter, params['battery'], params['range'])
+
+
+def get_factory(vehicle_type: str):
+    return _factories.get(vehicle_type.lower())
+
+
+class FleetImport:
+    def __init__(self):
+        self.vehicles = []
+        self.errors = []
+        self.seconds = 0.0
+
+    @property
+    def records(self):
+        return len(self.vehicles) + len(self.errors)
+
+    @property
+    def records_per_second(self):
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+def read_fleet_records(path: str):
+    with open(path, newline="") as file:
+        if path.endswith(".jsonl"):
+            for line_no, line in enumerate(file, 1):
+                if line.strip():
+                    yield line_no, line
+        else:
+            import csv
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+
+
+def build_vehicles(chunk):
+    import json
+    vehicles, errors = [], []
+    for line_no, record in chunk:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            factory_info = get_factory(str(record.get('vehicle', '')))
+            if not factory_info:
+                raise ValueError(f"unknown vehicle type {record.get('vehicle')!r}")
+            factory, schema = factory_info
+            missing = [name for name, _ in schema if record.get(name) in (None, '')]
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+            vehicles.append(factory.create_vehicle(coerce_params(schema, record)))
+        except (ValueError, TypeError, AttributeError) as e:
+            errors.append((line_no, str(e)))
+    return vehicles, errors
+
+
+def import_fleet(path: str, chunk_size: int = 10000, processes: int = None) -> FleetImport:
+    result = FleetImport()
+    start = time.perf_counter()
+    records = read_fleet_records(path)
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+
+    def collect(vehicles, errors):
+        result.vehicles.extend(vehicles)
+        result.errors.extend(errors)
+
+    if processes:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(processes) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(build_vehicles, chunk))
+                if len(pending) >= processes * 2:
+                    collect(*pending.popleft().result())
+            while pending:
+                collect(*pending.popleft().result())
+    else:
+        for chunk in chunks:
+            collect(*build_vehicles(chunk))
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _churn_fleet(factory, params, iterations, live):
+    fleet = deque()
+    for _ in range(iterations):
+        fleet.append(factory.create_vehicle(params))
+        if len(fleet) >= live:
+            factory.release(fleet.popleft())
+    return fleet
+
+
+def _pool_factory(pooled, live):
+    factory = CarFactory()
+    if pooled:
+        factory.enable_pool(live)
+    return factory
+
+
+def benchmark_vehicle_pool(iterations: int = 1000000, live: int = 100):
+    import tracemalloc
+    params = {'make': 'Toyota', 'model': 'Corolla', 'fuel': 'petrol'}
+    results = {}
+    for label, pooled in (('unpooled', False), ('pooled', True)):
+        factory = _pool_factory(pooled, live)
+        start = time.perf_counter()
+        _churn_fleet(factory, params, iterations, live)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        fleet = _churn_fleet(_pool_factory(pooled, live), params, iterations, live)
+        _, peak = tracemalloc.get_traced_memory()
+        retained = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, __file__)]
+        ).statistics('filename')
+        tracemalloc.stop()
+        del fleet
+        results[label] = {
+            'seconds': elapsed,
+            'vehicles_per_second': iterations / elapsed,
+            'peak_bytes': peak,
+            'retained_blocks': sum(stat.count for stat in retained),
+            'retained_bytes': sum(stat.size for stat in retained),
+        }
+        if pooled:
+            results[label]['pool_created'] = factory.pool.created
+            results[label]['pool_reused'] = factory.pool.reused
+    return results
+
+
+def main():
+    if sys.argv[1:] == ['--bench-pool']:
+        for label, stats in benchmark_vehicle_pool().items():
+            print(f"{label}: {stats['vehicles_per_second']:.0f} vehicles/s, peak {stats['peak_bytes']} bytes, "
+                  f"{stats['retained_blocks']} blocks / {stats['retained_bytes']} bytes retained by hw4")
+        return
+
+    if len(sys.argv) > 1:
+        fleet = import_fleet(sys.argv[1])
+        for line_no, error in fleet.errors:
+            print(f"Line {line_no}: {error}")
+        print(f"Imported {len(fleet.vehicles)} vehicles, {len(fleet.errors)} bad rows "
+              f"({fleet.records_per_second:.0f} records/s)")
+        return
+
+    print("Vehicle types: Car, Motorcycle, Truck, Bus, Scooter")
+    vehicle_type = input("Enter vehicle type: ").strip()
+    factory_info = get_factory(vehicle_type)
+
+    if not factory_info:
+        print("Unknown vehicle type.")
+        return
+
+    factory, schema = factory_info
+    params = {}
+
+    for param, _ in schema:
+        params[param] = input(f"Enter {param}: ").strip()
+
+    try:
+        params = coerce_params(schema, params)
+    except ValueError as e:
+        print(f"Invalid parameter: {e}")
+        return
+
+    vehicle = factory.create_vehicle(params)
+    vehicle.drive()
+    vehicle.refuel()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
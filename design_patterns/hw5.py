@@ -1,8 +1,13 @@
 import threading
 import os
 import copy
+import io
+import time
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
+from .output import emit
+
 
 class ConfigurationManager:
     _instance = None
@@ -54,10 +59,8 @@ class Report:
         self.footer = ""
 
     def display(self):
-        print("Header:", self.header)
-        print("Content:", self.content)
-        print("Footer:", self.footer)
-        print()
+        emit("Report", "report", "Header: {header}\nContent: {content}\nFooter: {footer}\n",
+             header=self.header, content=self.content, footer=self.footer)
 
 
 class IReportBuilder(ABC):
@@ -108,6 +111,63 @@ class HtmlReportBuilder(IReportBuilder):
         return self.report
 
 
+class StreamingReportBuilder(IReportBuilder):
+    def __init__(self, writer):
+        self.writer = writer
+
+    def set_content(self, content):
+        self.begin_content()
+        chunks = [content] if isinstance(content, str) else content
+        for chunk in chunks:
+            self.add_content(chunk)
+        self.end_content()
+
+    def begin_content(self):
+        pass
+
+    @abstractmethod
+    def add_content(self, chunk): pass
+
+    def end_content(self):
+        pass
+
+    def get_report(self):
+        if hasattr(self.writer, "flush"):
+            self.writer.flush()
+        return self.writer
+
+
+class TextStreamReportBuilder(StreamingReportBuilder):
+    def set_header(self, header):
+        self.writer.write(f"[TEXT] {header}\n")
+
+    def add_content(self, chunk):
+        self.writer.write(chunk)
+
+    def end_content(self):
+        self.writer.write("\n")
+
+    def set_footer(self, footer):
+        self.writer.write(f"{footer}\n")
+
+
+class HtmlStreamReportBuilder(StreamingReportBuilder):
+    def set_header(self, header):
+        self.writer.write(f"<h1>{header}</h1>\n")
+
+    def begin_content(self):
+        self.writer.write("<p>")
+
+    def add_content(self, chunk):
+        self.writer.write(chunk)
+
+    def end_content(self):
+        self.writer.write("</p>\n")
+
+    def set_footer(self, footer):
+        self.writer.write(f"<footer>{footer}</footer>\n")
+
+
 class ReportDirector:
     def construct_report(self, builder, header, content, footer):
         builder.set_header(header)
@@ -116,6 +176,51 @@ class ReportDirector:
         return builder.get_report()
 
 
+@lru_cache(maxsize=1024)
+def _render_fragment(builder_class, part, text):
+    buffer = io.StringIO()
+    getattr(builder_class(buffer), f"set_{part}")(text)
+    return buffer.getvalue()
+
+
+def _render_batch(builder_class, extension, jobs, output_dir):
+    for name, header, content, footer in jobs:
+        path = os.path.join(output_dir, f"{name}.{extension}")
+        with open(path, "w") as file:
+            file.write(_render_fragment(builder_class, "header", header))
+            builder_class(file).set_content(content)
+            file.write(_render_fragment(builder_class, "footer", footer))
+    return len(jobs)
+
+
+class BatchReportDirector:
+    def __init__(self, builders, output_dir, processes=None, batch_size=500):
+        self.builders = builders
+        self.output_dir = output_dir
+        self.processes = processes
+        self.batch_size = batch_size
+
+    def construct_reports(self, jobs):
+        from concurrent.futures import ProcessPoolExecutor
+        os.makedirs(self.output_dir, exist_ok=True)
+        jobs = list(jobs)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(self.processes) as pool:
+            futures = [
+                pool.submit(_render_batch, builder_class, extension,
+                            jobs[i:i + self.batch_size], self.output_dir)
+                for extension, builder_class in self.builders.items()
+                for i in range(0, len(jobs), self.batch_size)
+            ]
+            written = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+        return {
+            "reports": written,
+            "seconds": elapsed,
+            "reports_per_second": written / elapsed if elapsed else 0.0,
+        }
+
+
 class Discount:
     def __init__(self, name, percentage):
         self.name = name
@@ -153,6 +258,7 @@ class Order:
 
 
 def run_tests():
+    import tempfile
     config1 = ConfigurationManager.get_instance()
     config2 = ConfigurationManager.get_instance()
     config1.set_setting("theme", "dark")
@@ -164,6 +270,18 @@ def run_tests():
     text_report.display()
     html_report.display()
 
+    stream = io.StringIO()
+    chunks = ("Sales up 20% ", "& costs < budget")
+    director.construct_report(HtmlStreamReportBuilder(stream), "Q1 Report", chunks, "End of Report")
+    print(stream.getvalue())
+
+    jobs = [(f"customer_{i}", "Q1 Report", f"Sales for customer {i}", "End of Report") for i in range(100)]
+    with tempfile.TemporaryDirectory() as output_dir:
+        builders = {"txt": TextStreamReportBuilder, "html": HtmlStreamReportBuilder}
+        batch = BatchReportDirector(builders, output_dir)
+        stats = batch.construct_reports(jobs)
+    print(f"Wrote {stats['reports']} reports ({stats['reports_per_second']:.0f} reports/s)")
+
     base_product = Product("Laptop", 1200, 1)
     base_discount = Discount("Standard", 0.10)
     base_order = Order(1, [base_product], 25, base_discount)
@@ -1,3 +1,5 @@
+from .output import emit
+
 class Beverage:
     def get_description(self):
         return "Unknown"
@@ -64,11 +66,11 @@ class IPaymentProcessor:
 
 class PayPalPaymentProcessor(IPaymentProcessor):
     def process_payment(self, amount):
-        print(f"Paid {amount:.2f} with PayPal")
+        emit("PayPalPaymentProcessor", "paid", "Paid {amount:.2f} with PayPal", amount=amount)
 
 class StripePaymentService:
     def make_transaction(self, total_amount):
-        print(f"Paid {total_amount:.2f} with Stripe")
+        emit("StripePaymentService", "paid", "Paid {amount:.2f} with Stripe", amount=total_amount)
 
 class StripePaymentAdapter(IPaymentProcessor):
     def __init__(self):
@@ -79,7 +81,7 @@ class StripePaymentAdapter(IPaymentProcessor):
 
 class AnotherPaymentService:
     def pay(self, value):
-        print(f"Paid {value:.2f} with AnotherService")
+        emit("AnotherPaymentService", "paid", "Paid {amount:.2f} with AnotherService", amount=value)
 
 class AnotherPaymentAdapter(IPaymentProcessor):
     def __init__(self):
@@ -88,19 +90,24 @@ class AnotherPaymentAdapter(IPaymentProcessor):
     def process_payment(self, amount):
         self.service.pay(amount)
 
-drink = Mocha()
-drink = Milk(drink)
-drink = Sugar(drink)
-drink = WhippedCream(drink)
+def main():
+    drink = Mocha()
+    drink = Milk(drink)
+    drink = Sugar(drink)
+    drink = WhippedCream(drink)
+
+    print(drink.get_description())
+    print(f"Total: {drink.cost():.2f}")
+
+    processors = [
+        PayPalPaymentProcessor(),
+        StripePaymentAdapter(),
+        AnotherPaymentAdapter()
+    ]
 
-print(drink.get_description())
-print(f"Total: {drink.cost():.2f}")
+    for processor in processors:
+        processor.process_payment(drink.cost())
 
-processors = [
-    PayPalPaymentProcessor(),
-    StripePaymentAdapter(),
-    AnotherPaymentAdapter()
-]
 
-for processor in processors:
-    processor.process_payment(drink.cost())
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+import time
+
+from .output import emit
+
+class TV:
+    def on(self):
+        emit("TV", "on", "TV on")
+
+    def off(self):
+        emit("TV", "off", "TV off")
+
+    def set_channel(self, channel):
+        emit("TV", "channel", "TV channel set to {channel}", channel=channel)
+
+class AudioSystem:
+    def on(self):
+        emit("AudioSystem", "on", "AudioSystem on")
+
+    def off(self):
+        emit("AudioSystem", "off", "AudioSystem off")
+
+    def set_volume(self, level):
+        emit("AudioSystem", "volume", "Volume set to {level}", level=level)
+
+class DVDPlayer:
+    def play(self):
+        emit("DVDPlayer", "play", "DVD playing")
+
+    def pause(self):
+        emit("DVDPlayer", "pause", "DVD paused")
+
+    def stop(self):
+        emit("DVDPlayer", "stop", "DVD stopped")
+
+class GameConsole:
+    def on(self):
+        emit("GameConsole", "on", "GameConsole on")
+
+    def start_game(self):
+        emit("GameConsole", "start_game", "Game started")
+
+class Step:
+    def __init__(self, setting, value, after=()):
+        self.setting = setting
+        self.value = value
+        self.after = after
+
+SCENES = {
+    "watch_movie": (
+        Step("tv", True),
+        Step("audio", True),
+        Step("volume", 5, after=("audio",)),
+        Step("channel", "HDMI1", after=("tv",)),
+        Step("dvd", "playing", after=("channel", "volume")),
+    ),
+    "stop_movie": (
+        Step("dvd", "stopped"),
+        Step("tv", False, after=("dvd",)),
+        Step("audio", False, after=("dvd",)),
+    ),
+    "play_game": (
+        Step("tv", True),
+        Step("audio", True),
+        Step("channel", "HDMI2", after=("tv",)),
+        Step("console", True),
+        Step("game", "started", after=("console", "channel", "audio")),
+    ),
+    "listen_music": (
+        Step("tv", True),
+        Step("audio", True),
+        Step("channel", "AUX", after=("tv",)),
+    ),
+}
+
+def device_command(setting, value):
+    if setting == "volume":
+        return "audio", "set_volume", (value,)
+    if setting == "channel":
+        return "tv", "set_channel", (value,)
+    if setting == "dvd":
+        return "dvd", {"playing": "play", "paused": "pause", "stopped": "stop"}[value], ()
+    if setting == "console":
+        return "game", "on", ()
+    if setting == "game":
+        return "game", "start_game", ()
+    return setting, "on" if value else "off", ()
+
+class SceneState:
+    forgotten_on_power_off = {"tv": "channel", "audio": "volume"}
+
+    def __init__(self):
+        self.state = {}
+        self.commands_sent = 0
+        self.commands_saved = 0
+
+    def pending_steps(self, steps):
+        pending = []
+        for step in steps:
+            if step.setting in self.state and self.state[step.setting] == step.value:
+                self.commands_saved += 1
+            else:
+                pending.append(step)
+        return pending
+
+    def record(self, step):
+        self.state[step.setting] = step.value
+        self.commands_sent += 1
+        if step.value is False:
+            self.state.pop(self.forgotten_on_power_off.get(step.setting), None)
+
+class HomeTheaterFacade(SceneState):
+    def __init__(self):
+        super().__init__()
+        self.tv = TV()
+        self.audio = AudioSystem()
+        self.dvd = DVDPlayer()
+        self.game = GameConsole()
+
+    def watch_movie(self):
+        self.run_scene(SCENES["watch_movie"])
+
+    def stop_movie(self):
+        self.run_scene(SCENES["stop_movie"])
+
+    def play_game(self):
+        self.run_scene(SCENES["play_game"])
+
+    def listen_music(self):
+        self.run_scene(SCENES["listen_music"])
+
+    def set_volume(self, level):
+        self.run_scene((Step("volume", level),))
+
+    def run_scene(self, steps):
+        for step in self.pending_steps(steps):
+            device, method, args = device_command(step.setting, step.value)
+            getattr(getattr(self, device), method)(*args)
+            self.record(step)
+
+class SimulatedDevice:
+    def __init__(self, device, latency=0.0):
+        self.device = device
+        self.latency = latency
+
+    async def call(self, method, *args):
+        import asyncio
+        await asyncio.sleep(self.latency)
+        getattr(self.device, method)(*args)
+
+class AsyncHomeTheaterFacade(SceneState):
+    def __init__(self, devices=None, timeouts=None, default_timeout=2.0):
+        super().__init__()
+        self.devices = devices or {
+            "tv": SimulatedDevice(TV()),
+            "audio": SimulatedDevice(AudioSystem()),
+            "dvd": SimulatedDevice(DVDPlayer()),
+            "game": SimulatedDevice(GameConsole()),
+        }
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+
+    async def run_scene(self, steps):
+        import asyncio
+        pending = self.pending_steps(steps)
+        tasks = {}
+
+        async def run(step):
+            await asyncio.gather(*(tasks[dep] for dep in step.after if dep in tasks))
+            await self._send(step)
+
+        for step in pending:
+            tasks[step.setting] = asyncio.ensure_future(run(step))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def run_scene_sequentially(self, steps):
+        for step in self.pending_steps(steps):
+            await self._send(step)
+
+    async def _send(self, step):
+        import asyncio
+        device, method, args = device_command(step.setting, step.value)
+        timeout = self.timeouts.get(device, self.default_timeout)
+        await asyncio.wait_for(self.devices[device].call(method, *args), timeout)
+        self.record(step)
+
+    async def watch_movie(self):
+        await self.run_scene(SCENES["watch_movie"])
+
+    async def stop_movie(self):
+        await self.run_scene(SCENES["stop_movie"])
+
+    async def play_game(self):
+        await self.run_scene(SCENES["play_game"])
+
+    async def listen_music(self):
+        await self.run_scene(SCENES["listen_music"])
+
+    async def set_volume(self, level):
+        await self.run_scene((Step("volume", level),))
+
+class FileSystemComponent:
+    def display(self):
+        pass
+
+    def get_size(self):
+        pass
+
+class File(FileSystemComponent):
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+    def display(self):
+        emit("File", "display", "File: {name} ({size} KB)", name=self.name, size=self.size)
+
+    def get_size(self):
+        return self.size
+
+class Directory(FileSystemComponent):
+    def __init__(self, name):
+        self.name = name
+        self.contents = []
+
+    def add(self, component):
+        if component not in self.contents:
+            self.contents.append(component)
+
+    def remove(self, component):
+        if component in self.contents:
+            self.contents.remove(component)
+
+    def display(self):
+        emit("Directory", "display", "Directory: {name}", name=self.name)
+        for c in self.contents:
+            c.display()
+
+    def get_size(self):
+        return sum(c.get_size() for c in self.contents)
+
+def main():
+    import asyncio
+
+    theater = HomeTheaterFacade()
+    theater.watch_movie()
+    theater.set_volume(7)
+    theater.stop_movie()
+    theater.play_game()
+    theater.listen_music()
+    print(f"Commands sent: {theater.commands_sent}, saved: {theater.commands_saved}")
+
+    root = Directory("root")
+    docs = Directory("documents")
+    img = Directory("images")
+    file1 = File("resume.pdf", 120)
+    file2 = File("photo.jpg", 300)
+    file3 = File("notes.txt", 80)
+
+    docs.add(file1)
+    docs.add(file3)
+    img.add(file2)
+    root.add(docs)
+    root.add(img)
+
+    root.display()
+    print(f"Total size: {root.get_size()} KB")
+
+    def simulated_theater():
+        return AsyncHomeTheaterFacade({
+            name: SimulatedDevice(device, latency=0.1)
+            for name, device in (("tv", TV()), ("audio", AudioSystem()), ("dvd", DVDPlayer()), ("game", GameConsole()))
+        })
+
+    start = time.perf_counter()
+    asyncio.run(simulated_theater().run_scene_sequentially(SCENES["watch_movie"]))
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    asyncio.run(simulated_theater().watch_movie())
+    concurrent = time.perf_counter() - start
+    print(f"watch_movie: sequential {sequential:.2f}s, concurrent {concurrent:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
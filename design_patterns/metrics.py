@@ -0,0 +1,338 @@
+import argparse
+import bisect
+import cProfile
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from . import hw1, hw2, hw9, paymentsystem
+
+QUANTILES = (0.5, 0.95, 0.99)
+BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS, reservoir_size=1024):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.reservoir_size = reservoir_size
+        self.samples = []
+        self._rng = random.Random(0)
+
+    def observe(self, value):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(value)
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < self.reservoir_size:
+                self.samples[slot] = value
+
+    def percentile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class Metrics:
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, labels=(), value=1):
+        with self._lock:
+            self.counters[name, labels] += value
+
+    def observe(self, name, labels, value):
+        with self._lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[name, labels] = Histogram()
+            histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "counters": {_series(name, labels): value for (name, labels), value in self.counters.items()},
+                "histograms": {
+                    _series(name, labels): {
+                        "count": h.count,
+                        "sum": h.sum,
+                        "p50": h.percentile(0.5),
+                        "p95": h.percentile(0.95),
+                        "p99": h.percentile(0.99),
+                    }
+                    for (name, labels), h in self.histograms.items()
+                },
+            }
+
+    def write_prometheus(self, path):
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (series, labels), value in self.counters.items():
+                    if series == name:
+                        lines.append(f"{_series(name, labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (series, labels), h in self.histograms.items():
+                    if series != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(h.buckets + (float("inf"),), h.bucket_counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{_series(name + '_bucket', labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{_series(name + '_sum', labels)} {h.sum!r}")
+                    lines.append(f"{_series(name + '_count', labels)} {h.count}")
+                lines.append(f"# TYPE {name}_reservoir summary")
+                for (series, labels), h in self.histograms.items():
+                    if series != name:
+                        continue
+                    for q in QUANTILES:
+                        lines.append(f"{_series(name + '_reservoir', labels + (('quantile', q),))} {h.percentile(q)!r}")
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+def _series(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+metrics = Metrics()
+_originals = []
+
+
+def _patch(owner, attribute, replacement):
+    _originals.append((owner, attribute, owner.__dict__[attribute]))
+    setattr(owner, attribute, replacement)
+
+
+def _timed_notify(subject, *args):
+    labels_subject = ("subject", f"{type(subject).__module__}.{type(subject).__name__}")
+    for observer in list(subject.observers):
+        start = time.perf_counter()
+        observer.update(*args)
+        metrics.observe("pattern_observer_update_seconds",
+                        (labels_subject, ("observer", type(observer).__name__)),
+                        time.perf_counter() - start)
+    metrics.inc("pattern_notifications_total", (labels_subject,))
+
+
+def _instrument_payment(context_class, method_name):
+    original = context_class.__dict__[method_name]
+    context = f"{context_class.__module__}.{context_class.__name__}"
+
+    def wrapper(self, amount):
+        start = time.perf_counter()
+        try:
+            return original(self, amount)
+        finally:
+            labels = (("context", context), ("strategy", type(self.strategy).__name__))
+            metrics.observe("pattern_payment_seconds", labels, time.perf_counter() - start)
+    _patch(context_class, method_name, wrapper)
+
+
+def _instrument_directory_size():
+    original = hw9.Directory.__dict__["get_size"]
+    depth = threading.local()
+
+    def get_size(self):
+        level = getattr(depth, "value", 0)
+        if level:
+            return original(self)
+        depth.value = 1
+        start = time.perf_counter()
+        try:
+            return original(self)
+        finally:
+            depth.value = 0
+            metrics.observe("pattern_directory_size_seconds", (), time.perf_counter() - start)
+    _patch(hw9.Directory, "get_size", get_size)
+
+
+def _instrument_calls(owner, method_name):
+    original = owner.__dict__[method_name]
+    labels = (("entry", f"{owner.__name__}.{method_name}"),)
+
+    def wrapper(self, *args, **kwargs):
+        metrics.inc("pattern_calls_total", labels)
+        return original(self, *args, **kwargs)
+    _patch(owner, method_name, wrapper)
+
+
+def enable():
+    if _originals:
+        return
+    _patch(hw2.CurrencyExchange, "notify_observers", lambda self: _timed_notify(self, self.rate))
+    _patch(paymentsystem.CurrencyExchange, "notify_observers", _timed_notify)
+    _instrument_payment(hw2.PaymentContext, "pay")
+    _instrument_payment(paymentsystem.PaymentContext, "execute_payment")
+    _instrument_directory_size()
+    _instrument_calls(hw1.Library, "issue_book")
+    _instrument_calls(hw1.Library, "return_book")
+
+
+def disable():
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+@contextmanager
+def profile(path=None, sort="cumulative", limit=20):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+        else:
+            pstats.Stats(profiler).sort_stats(sort).print_stats(limit)
+
+
+class Sampler:
+    def __init__(self, interval=0.001, thread=None):
+        self.interval = interval
+        self.thread_id = (thread or threading.current_thread()).ident
+        self.samples = Counter()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def top(self, limit=10):
+        return self.samples.most_common(limit)
+
+    def _run(self):
+        while self._running:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                code = frame.f_code
+                self.samples[f"{code.co_filename}:{code.co_name}"] += 1
+            time.sleep(self.interval)
+
+
+_LINE = re.compile(r'^(\w+?)(_bucket|_sum|_count)?(\{.*\})? (\S+)$')
+
+
+def read_prometheus(path):
+    counters = {}
+    histograms = defaultdict(lambda: {"buckets": [], "sum": 0.0, "count": 0, "quantiles": {}})
+    with open(path) as file:
+        for line in file:
+            match = _LINE.match(line.strip())
+            if not match or line.startswith("#"):
+                continue
+            name, suffix, labels, value = match.groups()
+            labels = labels or ""
+            if suffix == "_bucket":
+                le = re.search(r'le="([^"]+)"', labels).group(1)
+                key = name + re.sub(r',?le="[^"]+"', "", labels).replace("{}", "")
+                histograms[key]["buckets"].append((float(le), float(value)))
+            elif suffix in ("_sum", "_count"):
+                histograms[name + labels][suffix[1:]] = float(value)
+            elif 'quantile="' in labels:
+                q = re.search(r'quantile="([^"]+)"', labels).group(1)
+                key = name.removesuffix("_reservoir") + re.sub(r',?quantile="[^"]+"', "", labels).replace("{}", "")
+                histograms[key]["quantiles"][float(q)] = float(value)
+            else:
+                counters[name + labels] = float(value)
+    return counters, dict(histograms)
+
+
+def bucket_quantile(q, buckets):
+    total = buckets[-1][1] if buckets else 0
+    if not total:
+        return 0.0
+    rank = q * total
+    lower, previous = 0.0, 0.0
+    for bound, cumulative in buckets:
+        if cumulative >= rank:
+            if bound == float("inf"):
+                return lower
+            span = cumulative - previous
+            return lower + (bound - lower) * ((rank - previous) / span if span else 0)
+        lower, previous = bound, cumulative
+    return lower
+
+
+def report(path):
+    counters, histograms = read_prometheus(path)
+    for series, value in sorted(counters.items()):
+        print(f"{series:70} {value:>12,.0f}")
+    if histograms:
+        print(f"\n{'series':70} {'count':>10} {'mean':>10} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for series, h in sorted(histograms.items()):
+        mean = h["sum"] / h["count"] if h["count"] else 0.0
+        quantiles = [h["quantiles"].get(q, bucket_quantile(q, h["buckets"])) for q in QUANTILES]
+        print(f"{series:70} {h['count']:>10,.0f} " + " ".join(f"{v * 1e6:>8.1f}us" for v in [mean] + quantiles))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Collect and report pattern metrics.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    collect = commands.add_parser("collect", help="run the benchmark workloads instrumented")
+    collect.add_argument("path", help="Prometheus text file to write")
+    collect.add_argument("--scale", type=float, default=0.01)
+    collect.add_argument("--profile", help="also write cProfile stats to this file")
+    show = commands.add_parser("report", help="summarise a Prometheus text file")
+    show.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "collect":
+        from .bench import run_benchmarks
+        enable()
+        try:
+            if args.profile:
+                with profile(args.profile):
+                    run_benchmarks(scale=args.scale, repeat=1)
+            else:
+                run_benchmarks(scale=args.scale, repeat=1)
+        finally:
+            disable()
+        metrics.write_prometheus(args.path)
+    report(args.path)
+
+
+if __name__ == "__main__":
+    main()
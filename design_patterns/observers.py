@@ -0,0 +1,51 @@
+import weakref
+
+
+# Observers are held by weak reference, so the caller must keep them alive. An
+# observer created inline, as in register_observer(MobileApp()), is collected
+# straight away and never receives an update.
+class ObserverRegistry:
+    def __init__(self):
+        self._refs = {}
+
+    def add(self, observer):
+        key = id(observer)
+        if key in self._refs and self._refs[key]() is observer:
+            return
+        try:
+            ref = weakref.ref(observer, self._discard_ref(key))
+        except TypeError:
+            ref = lambda: observer
+        self._refs[key] = ref
+
+    def remove(self, observer):
+        ref = self._refs.get(id(observer))
+        if ref is None or ref() is not observer:
+            raise ValueError("observer is not registered")
+        del self._refs[id(observer)]
+
+    def discard(self, observer):
+        if observer in self:
+            self.remove(observer)
+
+    def _discard_ref(self, key):
+        registry = weakref.ref(self)
+
+        def callback(ref):
+            owner = registry()
+            if owner is not None and owner._refs.get(key) is ref:
+                del owner._refs[key]
+        return callback
+
+    def __contains__(self, observer):
+        ref = self._refs.get(id(observer))
+        return ref is not None and ref() is observer
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __iter__(self):
+        for ref in list(self._refs.values()):
+            observer = ref()
+            if observer is not None:
+                yield observer
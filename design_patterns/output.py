@@ -0,0 +1,132 @@
+import queue
+import sys
+import threading
+import time
+
+
+class Event:
+    __slots__ = ("source", "kind", "template", "fields", "timestamp")
+
+    def __init__(self, source, kind, template, fields):
+        self.source = source
+        self.kind = kind
+        self.template = template
+        self.fields = fields
+        self.timestamp = time.time()
+
+    @property
+    def text(self):
+        return self.template.format(**self.fields)
+
+
+class OutputSink:
+    enabled = True
+
+    def emit(self, event: Event):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class PrintSink(OutputSink):
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event):
+        line = event.text + "\n"
+        with self._lock:
+            sys.stdout.write(line)
+
+
+class NullSink(OutputSink):
+    enabled = False
+
+    def emit(self, event: Event):
+        pass
+
+
+class BufferedSink(OutputSink):
+    def __init__(self, stream=None, capacity=1000):
+        self.stream = stream
+        self.capacity = capacity
+        self.events = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event):
+        with self._lock:
+            self.events.append(event)
+            full = len(self.events) >= self.capacity
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            events, self.events = self.events, []
+        if events:
+            stream = self.stream or sys.stdout
+            stream.write("".join(event.text + "\n" for event in events))
+            stream.flush()
+
+
+class AsyncSink(OutputSink):
+    _stop = object()
+
+    def __init__(self, sink: OutputSink, max_queue=10000):
+        self.sink = sink
+        self.closed = False
+        self._queue = queue.Queue(max_queue)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def emit(self, event: Event):
+        if self.closed:
+            return
+        self._queue.put(event)
+
+    def flush(self):
+        if self.closed:
+            return
+        self._queue.join()
+        self.sink.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        self._queue.put(self._stop)
+        self._thread.join()
+        self.sink.close()
+
+    def _run(self):
+        while True:
+            event = self._queue.get()
+            try:
+                if event is self._stop:
+                    return
+                self.sink.emit(event)
+            finally:
+                self._queue.task_done()
+
+
+_sink = PrintSink()
+
+
+def get_sink() -> OutputSink:
+    return _sink
+
+
+def set_sink(sink: OutputSink) -> OutputSink:
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def emit(source, kind, template, **fields):
+    sink = _sink
+    if sink.enabled:
+        sink.emit(Event(source, kind, template, fields))
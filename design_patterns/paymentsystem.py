@@ -1,5 +1,8 @@
 import time
 
+from .observers import ObserverRegistry
+from .output import emit
+
 class PaymentStrategy:
     def pay(self, amount: float):
         raise NotImplementedError
@@ -10,7 +13,7 @@ class CardPayment(PaymentStrategy):
         self.card_number = card_number
 
     def pay(self, amount: float):
-        print(f"Paid ${amount:.2f} with Card ending in {self.card_number[-4:]}.")
+        emit("CardPayment", "paid", "Paid ${amount:.2f} with Card ending in {card}.", amount=amount, card=self.card_number[-4:])
 
 
 class PayPalPayment(PaymentStrategy):
@@ -18,7 +21,7 @@ class PayPalPayment(PaymentStrategy):
         self.email = email
 
     def pay(self, amount: float):
-        print(f"Paid ${amount:.2f} via PayPal ({self.email}).")
+        emit("PayPalPayment", "paid", "Paid ${amount:.2f} via PayPal ({email}).", amount=amount, email=self.email)
 
 
 class CryptoPayment(PaymentStrategy):
@@ -26,7 +29,8 @@ class CryptoPayment(PaymentStrategy):
         self.wallet_id = wallet_id
 
     def pay(self, amount: float):
-        print(f"Paid ${amount:.2f} BTC equivalent (Wallet ID: {self.wallet_id[:6]}...).")
+        emit("CryptoPayment", "paid", "Paid ${amount:.2f} BTC equivalent (Wallet ID: {wallet}...).",
+             amount=amount, wallet=self.wallet_id[:6])
 
 
 class PaymentContext:
@@ -66,25 +70,25 @@ class ISubject:
 
 class CurrencyExchange(ISubject):
     def __init__(self):
-        self.observers = []
+        self.observers = ObserverRegistry()
         self.rates = {}
 
     def register_observer(self, observer: IObserver):
-        self.observers.append(observer)
-        print(f"{observer.name} subscribed to updates.")
+        self.observers.add(observer)
+        emit("CurrencyExchange", "subscribed", "{name} subscribed to updates.", name=observer.name)
 
     def remove_observer(self, observer: IObserver):
         if observer in self.observers:
             self.observers.remove(observer)
-            print(f"{observer.name} unsubscribed.")
+            emit("CurrencyExchange", "unsubscribed", "{name} unsubscribed.", name=observer.name)
         else:
-            print(f"{observer.name} not found in subscriber list.")
+            emit("CurrencyExchange", "unknown_observer", "{name} not found in subscriber list.", name=observer.name)
 
     def set_rate(self, name: str, new_rate: float):
         if new_rate <= 0:
             return
         self.rates[name] = Currency(name, new_rate)
-        print(f"\nExchange rate for {name} updated to {new_rate:.4f}")
+        emit("CurrencyExchange", "rate_updated", "\nExchange rate for {name} updated to {rate:.4f}", name=name, rate=new_rate)
         self.notify_observers(self.rates[name])
 
     def notify_observers(self, currency_data: Currency):
@@ -97,7 +101,8 @@ class SimpleDisplay(IObserver):
         self.name = name
 
     def update(self, currency_data: Currency):
-        print(f"[{self.name}] {currency_data.name}: {currency_data.rate:.4f}")
+        emit("SimpleDisplay", "rate_displayed", "[{name}] {currency}: {rate:.4f}",
+             name=self.name, currency=currency_data.name, rate=currency_data.rate)
 
 
 class AlertSystem(IObserver):
@@ -107,7 +112,8 @@ class AlertSystem(IObserver):
 
     def update(self, currency_data: Currency):
         if currency_data.rate >= self.threshold:
-            print(f"[{self.name}] ALERT: {currency_data.name} reached {currency_data.rate:.4f}!")
+            emit("AlertSystem", "rate_alert", "[{name}] ALERT: {currency} reached {rate:.4f}!",
+                 name=self.name, currency=currency_data.name, rate=currency_data.rate)
 
 
 class DataLogger(IObserver):
@@ -118,7 +124,7 @@ class DataLogger(IObserver):
     def update(self, currency_data: Currency):
         timestamp = time.strftime("%H:%M:%S")
         self.history.append((timestamp, currency_data.name, currency_data.rate))
-        print(f"[{self.name}] Logged at {timestamp}.")
+        emit("DataLogger", "logged", "[{name}] Logged at {timestamp}.", name=self.name, timestamp=timestamp)
 
 
 def run_strategy_test():
@@ -0,0 +1,287 @@
+import argparse
+import multiprocessing
+import os
+import random
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from .hw1 import Book, Library, Reader
+from .output import NullSink, set_sink
+
+
+class _IndexedLibrary(Library):
+    def __init__(self):
+        super().__init__()
+        self._books = defaultdict(list)
+        self._readers = {}
+
+    def add_book(self, book):
+        super().add_book(book)
+        self._books[book.isbn].append(book)
+
+    def remove_book(self, isbn):
+        super().remove_book(isbn)
+        if self._books.get(isbn):
+            self._books[isbn].pop(0)
+
+    def register_reader(self, reader):
+        super().register_reader(reader)
+        self._readers.setdefault(reader.reader_id, reader)
+
+    def find_reader(self, reader_id):
+        return self._readers.get(reader_id)
+
+    def find_book(self, isbn, available=False):
+        return next((b for b in self._books.get(isbn, ()) if b.copies > 0 or not available), None)
+
+
+def _issue_local(library, reader_id, isbn):
+    issued = library.checkout(reader_id, isbn)
+    if issued:
+        book, reader = issued
+        return book.title, reader.name
+    return None
+
+
+def _return_local(library, reader_id, isbn, restock=True):
+    status, book, reader = library.checkin(reader_id, isbn, restock)
+    if status == "ok":
+        return status, book.title, reader.name
+    return status, None, None
+
+
+def _reader_name(library, reader_id):
+    reader = library.find_reader(reader_id)
+    return reader.name if reader else None
+
+
+def _take_copy(library, isbn):
+    book = library.find_book(isbn, available=True)
+    if not book:
+        return None
+    book.copies -= 1
+    return book.title, book.author
+
+
+def _put_copy(library, isbn):
+    book = library.find_book(isbn)
+    if book:
+        book.copies += 1
+
+
+def _lend(library, reader_id, isbn, title, author):
+    library.find_reader(reader_id).borrowed_books.append(Book(title, author, isbn, 0))
+
+
+def _copies(library, isbn):
+    book = library.find_book(isbn)
+    return book.copies if book else None
+
+
+_OPERATIONS = {
+    "add_book": _IndexedLibrary.add_book,
+    "remove_book": _IndexedLibrary.remove_book,
+    "register_reader": _IndexedLibrary.register_reader,
+    "issue_local": _issue_local,
+    "return_local": _return_local,
+    "reader_name": _reader_name,
+    "take_copy": _take_copy,
+    "put_copy": _put_copy,
+    "lend": _lend,
+    "copies": _copies,
+}
+
+
+def _serve(conn):
+    library = _IndexedLibrary()
+    while True:
+        request = conn.recv()
+        if request is None:
+            conn.close()
+            return
+        op, args = request
+        try:
+            conn.send((True, _OPERATIONS[op](library, *args)))
+        except Exception as e:
+            conn.send((False, e))
+
+
+def shard_for(key, shards):
+    return zlib.crc32(key.encode()) % shards
+
+
+class ShardedLibrary:
+    def __init__(self, shards=None):
+        self.shards = shards or os.cpu_count()
+        self._connections = []
+        self._locks = []
+        self._processes = []
+        for _ in range(self.shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._locks.append(threading.Lock())
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for conn, lock in zip(self._connections, self._locks):
+            with lock:
+                conn.send(None)
+        for process in self._processes:
+            process.join()
+
+    def _call(self, shard, op, *args):
+        with self._locks[shard]:
+            conn = self._connections[shard]
+            conn.send((op, args))
+            ok, result = conn.recv()
+        if not ok:
+            raise result
+        return result
+
+    def add_book(self, book):
+        self._call(shard_for(book.isbn, self.shards), "add_book", book)
+
+    def remove_book(self, isbn):
+        self._call(shard_for(isbn, self.shards), "remove_book", isbn)
+
+    def register_reader(self, reader):
+        self._call(shard_for(reader.reader_id, self.shards), "register_reader", reader)
+
+    def copies(self, isbn):
+        return self._call(shard_for(isbn, self.shards), "copies", isbn)
+
+    def issue_book(self, reader_id, isbn):
+        reader_shard = shard_for(reader_id, self.shards)
+        book_shard = shard_for(isbn, self.shards)
+        if reader_shard == book_shard:
+            issued = self._call(book_shard, "issue_local", reader_id, isbn)
+        else:
+            issued = None
+            name = self._call(reader_shard, "reader_name", reader_id)
+            if name is not None:
+                book = self._call(book_shard, "take_copy", isbn)
+                if book is not None:
+                    self._call(reader_shard, "lend", reader_id, isbn, *book)
+                    issued = book[0], name
+        Library.report_issue(*issued or ())
+        return bool(issued)
+
+    def return_book(self, reader_id, isbn):
+        reader_shard = shard_for(reader_id, self.shards)
+        book_shard = shard_for(isbn, self.shards)
+        local = reader_shard == book_shard
+        status, title, name = self._call(reader_shard, "return_local", reader_id, isbn, local)
+        if status == "ok" and not local:
+            self._call(book_shard, "put_copy", isbn)
+        Library.report_return(status, title, name)
+        return status == "ok"
+
+
+def benchmark_scaling(max_shards=None, books=20000, readers=2000, operations=20000, seed=0):
+    max_shards = max_shards or os.cpu_count()
+    rng = random.Random(seed)
+    requests = [(f"R{rng.randrange(readers)}", str(rng.randrange(books))) for _ in range(operations // 2)]
+    previous = set_sink(NullSink())
+    results = {}
+    try:
+        for shards in range(1, max_shards + 1):
+            with ShardedLibrary(shards) as library:
+                for i in range(books):
+                    library.add_book(Book(f"Book {i}", "Author", str(i), 5))
+                for i in range(readers):
+                    library.register_reader(Reader(f"Reader {i}", f"R{i}"))
+
+                def checkout(request):
+                    library.issue_book(*request)
+                    library.return_book(*request)
+
+                start = time.perf_counter()
+                with ThreadPoolExecutor(shards * 4) as pool:
+                    list(pool.map(checkout, requests))
+                elapsed = time.perf_counter() - start
+            results[shards] = len(requests) * 2 / elapsed
+    finally:
+        set_sink(previous)
+    return results
+
+
+def check_copy_accounting(shards=4, books=40, readers=20, operations=2000, seed=0):
+    rng = random.Random(seed)
+    isbns = [str(i) for i in range(books)]
+    reader_ids = [f"R{i}" for i in range(readers)]
+    reference = Library()
+    previous = set_sink(NullSink())
+    try:
+        with ShardedLibrary(shards) as library:
+            for target in (reference, library):
+                for isbn in isbns:
+                    target.add_book(Book(f"Book {isbn}", "Author", isbn, 2))
+                for reader_id in reader_ids:
+                    target.register_reader(Reader(f"Reader {reader_id}", reader_id))
+
+            for _ in range(operations):
+                request = rng.choice(reader_ids + ["missing"]), rng.choice(isbns)
+                action = rng.choice(("issue_book", "return_book", "return_book"))
+                expected = getattr(reference, action)(*request)
+                actual = getattr(library, action)(*request)
+                assert actual == expected, f"{action}{request}: sharded {actual}, reference {expected}"
+            for isbn in isbns:
+                assert library.copies(isbn) == reference.find_book(isbn).copies, f"copies of {isbn} diverged"
+
+            removed = isbns.pop()
+            reference.remove_book(removed)
+            library.remove_book(removed)
+            assert library.copies(removed) is None
+            for reader_id in reader_ids:
+                assert library.return_book(reader_id, removed) == reference.return_book(reader_id, removed)
+                assert not library.issue_book(reader_id, removed)
+
+            for reader_id in reader_ids:
+                for isbn in isbns:
+                    while reference.return_book(reader_id, isbn):
+                        assert library.return_book(reader_id, isbn)
+
+            def checkout(request):
+                if library.issue_book(*request):
+                    assert library.return_book(*request)
+
+            requests = [(rng.choice(reader_ids), rng.choice(isbns)) for _ in range(operations)]
+            with ThreadPoolExecutor(shards * 4) as pool:
+                list(pool.map(checkout, requests))
+            for isbn in isbns:
+                assert library.copies(isbn) == 2, f"copies of {isbn} leaked under concurrency"
+    finally:
+        set_sink(previous)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sharded library throughput from 1 to N shards.")
+    parser.add_argument("--shards", type=int, default=os.cpu_count())
+    parser.add_argument("--books", type=int, default=20000)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--check", action="store_true", help="verify cross-shard copy accounting and exit")
+    args = parser.parse_args()
+    if args.check:
+        check_copy_accounting(args.shards)
+        print("copy accounting ok")
+        return
+    results = benchmark_scaling(args.shards, books=args.books, operations=args.operations)
+    base = results[1]
+    for shards, rate in results.items():
+        print(f"{shards:3} shards: {rate:>10,.0f} ops/s ({rate / base:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
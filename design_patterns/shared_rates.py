@@ -0,0 +1,259 @@
+import argparse
+import multiprocessing
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from .output import emit
+from .paymentsystem import Currency, IObserver
+
+_HEADER = struct.Struct("<QQ")
+_SLOT = struct.Struct("<Q16sdd")
+_VERSION = struct.Struct("<Q")
+_NAME_SIZE = 16
+_tracker_lock = threading.Lock()
+
+
+def _open_untracked(name):
+    # Only the creating process may unlink the segment. A tracked attach would
+    # make the resource tracker unlink it when an unrelated reader exits.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    with _tracker_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedRateTable:
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.capacity, _ = _HEADER.unpack_from(shm.buf, 0)
+        self._slots = {}
+        for slot in range(self.capacity):
+            _, name, _, _ = _SLOT.unpack_from(shm.buf, self._offset(slot))
+            name = name.rstrip(b"\0").decode()
+            if name:
+                self._slots[name] = slot
+
+    @classmethod
+    def create(cls, pairs, name=None):
+        pairs = list(pairs)
+        for pair in pairs:
+            encoded = pair.encode()
+            if not encoded or len(encoded) > _NAME_SIZE or b"\0" in encoded:
+                raise ValueError(f"pair name {pair!r} must be 1 to {_NAME_SIZE} bytes without NUL")
+        if len(set(pairs)) != len(pairs):
+            raise ValueError("pair names must be unique")
+        size = _HEADER.size + _SLOT.size * len(pairs)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, len(pairs), 0)
+        for slot, pair in enumerate(pairs):
+            _SLOT.pack_into(shm.buf, _HEADER.size + slot * _SLOT.size, 0, pair.encode(), 0.0, 0.0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        return cls(_open_untracked(name), owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def pairs(self):
+        return list(self._slots)
+
+    def __contains__(self, pair):
+        return pair in self._slots
+
+    def _offset(self, slot):
+        return _HEADER.size + slot * _SLOT.size
+
+    def publish(self, pair, rate, timestamp=None):
+        offset = self._offset(self._slots[pair])
+        buf = self.shm.buf
+        version = _VERSION.unpack_from(buf, offset)[0]
+        _VERSION.pack_into(buf, offset, version + 1)
+        _SLOT.pack_into(buf, offset, version + 1, pair.encode(), rate, timestamp or time.time())
+        _VERSION.pack_into(buf, offset, version + 2)
+
+    def read(self, pair):
+        offset = self._offset(self._slots[pair])
+        buf = self.shm.buf
+        while True:
+            before = _VERSION.unpack_from(buf, offset)[0]
+            if before & 1:
+                continue
+            _, _, rate, timestamp = _SLOT.unpack_from(buf, offset)
+            if _VERSION.unpack_from(buf, offset)[0] == before:
+                if not before:
+                    raise LookupError(f"no rate has been published for {pair}")
+                return rate, timestamp, before
+
+    def version(self, pair):
+        return _VERSION.unpack_from(self.shm.buf, self._offset(self._slots[pair]))[0]
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class CrossRateCache:
+    def __init__(self, table, pivots=("USD", "EUR")):
+        self.table = table
+        self.pivots = pivots
+        self._routes = {}
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def rate(self, base, quote):
+        key = base, quote
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = self._find_route(base, quote)
+        versions = tuple(self.table.version(pair) for pair, _ in route)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == versions and not any(v & 1 for v in versions):
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        rate = 1.0
+        read_versions = []
+        for pair, inverse in route:
+            leg, _, version = self.table.read(pair)
+            rate *= 1 / leg if inverse else leg
+            read_versions.append(version)
+        self._cache[key] = tuple(read_versions), rate
+        return rate
+
+    def _leg(self, base, quote):
+        if f"{base}/{quote}" in self.table:
+            return f"{base}/{quote}", False
+        if f"{quote}/{base}" in self.table:
+            return f"{quote}/{base}", True
+        return None
+
+    def _find_route(self, base, quote):
+        direct = self._leg(base, quote)
+        if direct:
+            return (direct,)
+        for pivot in self.pivots:
+            first, second = self._leg(base, pivot), self._leg(pivot, quote)
+            if first and second:
+                return first, second
+        raise KeyError(f"no route from {base} to {quote}")
+
+
+class SharedRatePublisher(IObserver):
+    def __init__(self, table, pair=None, name="Shared Rate Table"):
+        self.table = table
+        self.pair = pair
+        self.name = name
+
+    def update(self, currency_data):
+        if isinstance(currency_data, Currency):
+            pair, rate = currency_data.name, currency_data.rate
+        else:
+            pair, rate = self.pair, currency_data
+        if pair not in self.table:
+            emit("SharedRatePublisher", "unknown_pair", "{name}: no slot for {pair}, update skipped", name=self.name, pair=pair)
+            return
+        self.table.publish(pair, rate)
+
+
+def _reader(table_name, results):
+    table = SharedRateTable.attach(table_name)
+    cache = CrossRateCache(table)
+    results.put((cache.rate("EUR", "GBP"), cache.rate("EUR", "GBP"), cache.hits))
+    table.close()
+
+
+_UNRELATED_READER = """
+import sys
+from design_patterns.shared_rates import SharedRateTable
+table = SharedRateTable.attach(sys.argv[1])
+print(table.read("EUR/USD")[0])
+table.close()
+"""
+
+
+def check_unrelated_readers(readers=3):
+    try:
+        SharedRateTable.create(["EUR/USD", "X" * (_NAME_SIZE + 1)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("over-long pair name was accepted")
+
+    table = SharedRateTable.create(["EUR/USD", "GBP/USD"])
+    try:
+        try:
+            table.read("EUR/USD")
+        except LookupError:
+            pass
+        else:
+            raise AssertionError("unpublished slot was read as a rate")
+        SharedRatePublisher(table, pair="USD/CHF").update(0.91)
+        table.publish("EUR/USD", 1.0850)
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH")))))
+        for _ in range(readers):
+            result = subprocess.run([sys.executable, "-c", _UNRELATED_READER, table.name],
+                                    capture_output=True, text=True, env=env)
+            assert result.returncode == 0, result.stderr
+            assert not result.stderr, result.stderr
+            assert float(result.stdout) == 1.0850
+        reader = SharedRateTable.attach(table.name)
+        assert reader.read("EUR/USD")[0] == 1.0850
+        reader.close()
+    finally:
+        table.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish rates to shared memory and read them from other processes.")
+    parser.add_argument("--check", action="store_true", help="verify attach and unlink across unrelated processes and exit")
+    args = parser.parse_args()
+    if args.check:
+        check_unrelated_readers()
+        print("shared rate table ok")
+        return
+
+    from .paymentsystem import CurrencyExchange
+
+    table = SharedRateTable.create(["EUR/USD", "GBP/USD", "USD/JPY"])
+    try:
+        exchange = CurrencyExchange()
+        publisher = SharedRatePublisher(table)
+        exchange.register_observer(publisher)
+        exchange.set_rate("EUR/USD", 1.0850)
+        exchange.set_rate("GBP/USD", 1.2700)
+        exchange.set_rate("USD/JPY", 151.20)
+
+        results = multiprocessing.Queue()
+        readers = [multiprocessing.Process(target=_reader, args=(table.name, results)) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        for _ in readers:
+            rate, cached, hits = results.get()
+            print(f"Reader saw EUR/GBP {rate:.4f} (cached {cached:.4f}, {hits} cache hit)")
+        for reader in readers:
+            reader.join()
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    main()